@@ -15,12 +15,23 @@ const ALLOWED_REDIRECT_PATTERNS = [
   /^http:\/\/localhost:\d+$/,  // MCP Inspector
 ];
 
+// Compiled once so registration does a single regex scan per URI
+const ALLOWED_REDIRECT_URI = new RegExp(ALLOWED_REDIRECT_PATTERNS.map(p => `(?:${p.source})`).join('|'));
+
 function isAllowedRedirectUri(uri: string): boolean {
-  return ALLOWED_REDIRECT_PATTERNS.some(p => p.test(uri));
+  return ALLOWED_REDIRECT_URI.test(uri);
+}
+
+function prepareStatements(db: Database.Database) {
+  return {
+    get: db.prepare('SELECT client_data FROM clients WHERE client_id = ?'),
+    insert: db.prepare('INSERT INTO clients (client_id, client_data, created_at) VALUES (?, ?, ?)'),
+  };
 }
 
 export class ClientRegistry implements OAuthRegisteredClientsStore {
   private db: Database.Database;
+  private stmts: ReturnType<typeof prepareStatements>;
 
   constructor(dbPath: string) {
     mkdirSync(dirname(dbPath), { recursive: true });
@@ -33,12 +44,11 @@ export class ClientRegistry implements OAuthRegisteredClientsStore {
         created_at INTEGER NOT NULL
       )
     `);
+    this.stmts = prepareStatements(this.db);
   }
 
   getClient(clientId: string): OAuthClientInformationFull | undefined {
-    const row = this.db.prepare('SELECT client_data FROM clients WHERE client_id = ?').get(clientId) as
-      | { client_data: string }
-      | undefined;
+    const row = this.stmts.get.get(clientId) as { client_data: string } | undefined;
     if (!row) return undefined;
     return JSON.parse(row.client_data);
   }
@@ -64,7 +74,7 @@ export class ClientRegistry implements OAuthRegisteredClientsStore {
       client_id_issued_at: now,
     };
 
-    this.db.prepare('INSERT INTO clients (client_id, client_data, created_at) VALUES (?, ?, ?)').run(
+    this.stmts.insert.run(
       clientId,
       JSON.stringify(fullClient),
       Date.now(),
@@ -1,4 +1,3 @@
-import { randomBytes, createHash } from 'node:crypto';
 import Database from 'better-sqlite3';
 import { mkdirSync } from 'node:fs';
 import { dirname } from 'node:path';
@@ -13,20 +12,13 @@ import type { AuthInfo } from '@modelcontextprotocol/sdk/server/auth/types.js';
 import type { Response } from 'express';
 import { ClientRegistry } from './client-registry.js';
 import { SessionStore } from '../enable-banking/session-store.js';
+import { generateToken, hashToken } from './tokens.js';
 import type { EnableBankingClient } from '../enable-banking/client.js';
 import { InvalidTokenError } from '@modelcontextprotocol/sdk/server/auth/errors.js';
 import { createLogger } from '../logger.js';
 
 const logger = createLogger();
 
-function generateToken(): string {
-  return randomBytes(32).toString('base64url');
-}
-
-function hashToken(token: string): string {
-  return createHash('sha256').update(token).digest('hex');
-}
-
 interface PendingAuth {
   eb_state: string;
   claude_state: string;
@@ -68,10 +60,40 @@ export interface EnableBankingOAuthProviderOptions {
   enableBankingClient: EnableBankingClient;
 }
 
+function prepareStatements(db: Database.Database) {
+  return {
+    insertPendingAuth: db.prepare(`
+      INSERT INTO pending_auths (eb_state, claude_state, client_id, redirect_uri, code_challenge, code_challenge_method, created_at, expires_at)
+      VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    `),
+    consumePendingAuth: db.prepare('DELETE FROM pending_auths WHERE eb_state = ? RETURNING *'),
+    insertAuthCode: db.prepare(`
+      INSERT INTO auth_codes (code_hash, eb_session_id, account_uids, client_id, redirect_uri, code_challenge, created_at, expires_at, used)
+      VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+    `),
+    getCodeChallenge: db.prepare(
+      'SELECT code_challenge FROM auth_codes WHERE code_hash = ? AND used = 0 AND expires_at > ?',
+    ),
+    claimAuthCode: db.prepare(
+      'UPDATE auth_codes SET used = 1 WHERE code_hash = ? AND used = 0 AND expires_at > ? RETURNING *',
+    ),
+    getAuthCodeStatus: db.prepare('SELECT used, expires_at FROM auth_codes WHERE code_hash = ?'),
+    insertRefreshToken: db.prepare(`
+      INSERT INTO refresh_tokens (token_hash, eb_session_id, account_uids, client_id, created_at, expires_at, revoked)
+      VALUES (?, ?, ?, ?, ?, ?, 0)
+    `),
+    rotateRefreshToken: db.prepare(
+      'UPDATE refresh_tokens SET revoked = 1 WHERE token_hash = ? AND client_id = ? AND revoked = 0 AND expires_at > ? RETURNING *',
+    ),
+    revokeRefreshToken: db.prepare('UPDATE refresh_tokens SET revoked = 1 WHERE token_hash = ?'),
+  };
+}
+
 export class EnableBankingOAuthProvider implements OAuthServerProvider {
   private _clientsStore: ClientRegistry;
   private sessionStore: SessionStore;
   private db: Database.Database;
+  private stmts: ReturnType<typeof prepareStatements>;
   private ebClient: EnableBankingClient;
   private externalUrl: string;
   private aspspName: string;
@@ -118,6 +140,7 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
         revoked INTEGER DEFAULT 0
       );
     `);
+    this.stmts = prepareStatements(this.db);
 
     this.ebClient = enableBankingClient;
     this.externalUrl = externalUrl;
@@ -134,16 +157,13 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
     params: AuthorizationParams,
     res: Response,
   ): Promise<void> {
-    const ebState = randomBytes(32).toString('base64url');
+    const ebState = generateToken();
     const now = Date.now();
 
     logger.info({ clientId: client.client_id }, 'oauth.authorize.started');
 
     // Store pending auth linking EB state -> Claude context
-    this.db.prepare(`
-      INSERT INTO pending_auths (eb_state, claude_state, client_id, redirect_uri, code_challenge, code_challenge_method, created_at, expires_at)
-      VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    `).run(
+    this.stmts.insertPendingAuth.run(
       ebState,
       params.state || '',
       client.client_id,
@@ -165,7 +185,7 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
       );
 
       logger.info({ clientId: client.client_id }, 'oauth.authorize.redirecting_to_bank');
-      res.redirect(ebResponse.url);
+      res.status(302).location(ebResponse.url).end();
     } catch (err) {
       const errMsg = err instanceof Error ? err.message : String(err);
       logger.error({ err: errMsg, clientId: client.client_id }, 'oauth.authorize.failed');
@@ -174,7 +194,7 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
       errorUrl.searchParams.set('error', 'server_error');
       errorUrl.searchParams.set('error_description', `Bank auth failed: ${errMsg}`);
       if (params.state) errorUrl.searchParams.set('state', params.state);
-      res.redirect(errorUrl.toString());
+      res.status(302).location(errorUrl.toString()).end();
     }
   }
 
@@ -182,9 +202,7 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
     _client: OAuthClientInformationFull,
     authorizationCode: string,
   ): Promise<string> {
-    const record = this.db.prepare(
-      'SELECT code_challenge FROM auth_codes WHERE code_hash = ? AND used = 0 AND expires_at > ?',
-    ).get(hashToken(authorizationCode), Date.now()) as { code_challenge: string } | undefined;
+    const record = this.stmts.getCodeChallenge.get(hashToken(authorizationCode), Date.now()) as { code_challenge: string } | undefined;
 
     if (!record) {
       throw new Error('Invalid or expired authorization code');
@@ -201,20 +219,17 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
   ): Promise<OAuthTokens> {
     logger.info({ clientId: client.client_id, hasCode: !!authorizationCode, codeLen: authorizationCode?.length, redirectUri }, 'oauth.token.exchange_started');
     const codeHash = hashToken(authorizationCode);
-    const record = this.db.prepare(
-      'SELECT * FROM auth_codes WHERE code_hash = ? AND used = 0 AND expires_at > ?',
-    ).get(codeHash, Date.now()) as AuthCodeRecord | undefined;
+    const now = Date.now();
+    // Claim the code and mark it used in one statement (single-use, no read/write race)
+    const record = this.stmts.claimAuthCode.get(codeHash, now) as AuthCodeRecord | undefined;
 
     if (!record) {
       // Debug: check if code exists at all (maybe expired or used)
-      const anyRecord = this.db.prepare('SELECT used, expires_at FROM auth_codes WHERE code_hash = ?').get(codeHash) as { used: number; expires_at: number } | undefined;
-      logger.warn({ clientId: client.client_id, codeExists: !!anyRecord, used: anyRecord?.used, expired: anyRecord ? Date.now() > anyRecord.expires_at : undefined }, 'oauth.token.invalid_code');
+      const anyRecord = this.stmts.getAuthCodeStatus.get(codeHash) as { used: number; expires_at: number } | undefined;
+      logger.warn({ clientId: client.client_id, codeExists: !!anyRecord, used: anyRecord?.used, expired: anyRecord ? now > anyRecord.expires_at : undefined }, 'oauth.token.invalid_code');
       throw new Error('Invalid or expired authorization code');
     }
 
-    // Mark as used (single-use)
-    this.db.prepare('UPDATE auth_codes SET used = 1 WHERE code_hash = ?').run(codeHash);
-
     // Verify binding
     if (record.client_id !== client.client_id) {
       logger.warn({ clientId: client.client_id }, 'oauth.token.client_mismatch');
@@ -235,20 +250,17 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
       accessToken,
       record.eb_session_id,
       JSON.parse(record.account_uids),
-      Date.now() + expiresIn * 1000,
+      now + expiresIn * 1000,
     );
 
     // Store refresh token
-    this.db.prepare(`
-      INSERT INTO refresh_tokens (token_hash, eb_session_id, account_uids, client_id, created_at, expires_at, revoked)
-      VALUES (?, ?, ?, ?, ?, ?, 0)
-    `).run(
+    this.stmts.insertRefreshToken.run(
       hashToken(refreshToken),
       record.eb_session_id,
       record.account_uids,
       client.client_id,
-      Date.now(),
-      Date.now() + 90 * 24 * 3600_000, // 90 days — sliding, same as access token
+      now,
+      now + 90 * 24 * 3600_000, // 90 days — sliding, same as access token
     );
 
     logger.info({ clientId: client.client_id }, 'oauth.token.issued');
@@ -266,22 +278,15 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
     refreshToken: string,
   ): Promise<OAuthTokens> {
     const tokenHash = hashToken(refreshToken);
-    const record = this.db.prepare(
-      'SELECT * FROM refresh_tokens WHERE token_hash = ? AND revoked = 0 AND expires_at > ?',
-    ).get(tokenHash, Date.now()) as RefreshTokenRecord | undefined;
+    const now = Date.now();
+    // Rotate: revoke the old refresh token as part of the lookup, so it can only be used once
+    const record = this.stmts.rotateRefreshToken.get(tokenHash, client.client_id, now) as RefreshTokenRecord | undefined;
 
     if (!record) {
       logger.warn({ clientId: client.client_id }, 'oauth.refresh.invalid_token');
       throw new Error('Invalid or expired refresh token');
     }
 
-    if (record.client_id !== client.client_id) {
-      throw new Error('Client ID mismatch');
-    }
-
-    // Rotate: revoke old refresh token
-    this.db.prepare('UPDATE refresh_tokens SET revoked = 1 WHERE token_hash = ?').run(tokenHash);
-
     // Generate new tokens
     const newAccessToken = generateToken();
     const newRefreshToken = generateToken();
@@ -291,19 +296,16 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
       newAccessToken,
       record.eb_session_id,
       JSON.parse(record.account_uids),
-      Date.now() + expiresIn * 1000,
+      now + expiresIn * 1000,
     );
 
-    this.db.prepare(`
-      INSERT INTO refresh_tokens (token_hash, eb_session_id, account_uids, client_id, created_at, expires_at, revoked)
-      VALUES (?, ?, ?, ?, ?, ?, 0)
-    `).run(
+    this.stmts.insertRefreshToken.run(
       hashToken(newRefreshToken),
       record.eb_session_id,
       record.account_uids,
       client.client_id,
-      Date.now(),
-      Date.now() + 30 * 24 * 3600_000,
+      now,
+      now + 30 * 24 * 3600_000,
     );
 
     logger.info({ clientId: client.client_id }, 'oauth.refresh.issued');
@@ -344,7 +346,7 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
     this.sessionStore.revoke(request.token);
 
     // Try revoking as refresh token
-    this.db.prepare('UPDATE refresh_tokens SET revoked = 1 WHERE token_hash = ?').run(tokenHash);
+    this.stmts.revokeRefreshToken.run(tokenHash);
 
     logger.info('oauth.token.revoked');
   }
@@ -352,38 +354,31 @@ export class EnableBankingOAuthProvider implements OAuthServerProvider {
   // --- Enable Banking callback handler (not part of OAuthServerProvider) ---
 
   async handleEbCallback(ebCode: string, ebState: string): Promise<{ redirectUrl: string } | { error: string }> {
-    // Look up pending auth
-    const pending = this.db.prepare(
-      'SELECT * FROM pending_auths WHERE eb_state = ? AND expires_at > ?',
-    ).get(ebState, Date.now()) as PendingAuth | undefined;
+    // Look up and delete pending auth in one statement (single-use)
+    const pending = this.stmts.consumePendingAuth.get(ebState) as PendingAuth | undefined;
 
-    if (!pending) {
+    if (!pending || pending.expires_at <= Date.now()) {
       logger.warn('oauth.eb_callback.invalid_state');
       return { error: 'Invalid or expired state' };
     }
 
-    // Delete pending auth (single-use)
-    this.db.prepare('DELETE FROM pending_auths WHERE eb_state = ?').run(ebState);
-
     try {
       // Exchange EB code for session
       const session = await this.ebClient.createSession(ebCode);
       const accountUids = session.accounts.map(a => a.uid);
+      const now = Date.now();
 
       // Generate MCP authorization code
       const mcpCode = generateToken();
-      this.db.prepare(`
-        INSERT INTO auth_codes (code_hash, eb_session_id, account_uids, client_id, redirect_uri, code_challenge, created_at, expires_at, used)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
-      `).run(
+      this.stmts.insertAuthCode.run(
         hashToken(mcpCode),
         session.session_id,
         JSON.stringify(accountUids),
         pending.client_id,
         pending.redirect_uri,
         pending.code_challenge,
-        Date.now(),
-        Date.now() + 300_000, // 5 min TTL
+        now,
+        now + 300_000, // 5 min TTL
       );
 
       // Build redirect URL back to Claude
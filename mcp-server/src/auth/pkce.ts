@@ -1,8 +1,12 @@
-import { createHash } from 'node:crypto';
+import { createHash, timingSafeEqual } from 'node:crypto';
 
+// Not on the live token path: the SDK token handler checks PKCE itself using
+// challengeForAuthorizationCode. Kept for standalone use and tests.
 export function verifyPkce(codeVerifier: string, codeChallenge: string): boolean {
-  const computed = createHash('sha256').update(codeVerifier).digest('base64url');
-  return computed === codeChallenge;
+  const computed = Buffer.from(computeS256Challenge(codeVerifier));
+  const expected = Buffer.from(codeChallenge);
+  // Constant-time compare; length mismatch can't leak anything useful about a hash
+  return computed.length === expected.length && timingSafeEqual(computed, expected);
 }
 
 export function computeS256Challenge(codeVerifier: string): string {
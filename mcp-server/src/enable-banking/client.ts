@@ -41,8 +41,14 @@ export interface EnableBankingAspsp {
   [key: string]: unknown;
 }
 
+const JWT_TTL_SECONDS = 3600;
+// Re-sign this long before expiry so in-flight requests never carry a stale token
+const JWT_REFRESH_MARGIN_MS = 30_000;
+
 export class EnableBankingClient {
   private cachedKey: CryptoKey | KeyObject | null = null;
+  private cachedJwt: { token: string; expiresAt: number } | null = null;
+  private pendingJwt: Promise<string> | null = null;
 
   constructor(
     private appId: string,
@@ -58,14 +64,28 @@ export class EnableBankingClient {
   }
 
   async generateJwt(): Promise<string> {
+    if (this.cachedJwt && this.cachedJwt.expiresAt - Date.now() > JWT_REFRESH_MARGIN_MS) {
+      return this.cachedJwt.token;
+    }
+    // Concurrent callers share one signing operation
+    this.pendingJwt ??= this.signJwt().finally(() => {
+      this.pendingJwt = null;
+    });
+    return this.pendingJwt;
+  }
+
+  private async signJwt(): Promise<string> {
     const key = await this.getKey();
-    return new SignJWT({})
+    const issuedAt = Math.floor(Date.now() / 1000);
+    const token = await new SignJWT({})
       .setProtectedHeader({ alg: 'RS256', typ: 'JWT', kid: this.appId })
       .setIssuer('enablebanking.com')
       .setAudience('api.enablebanking.com')
-      .setIssuedAt()
-      .setExpirationTime('1h')
+      .setIssuedAt(issuedAt)
+      .setExpirationTime(issuedAt + JWT_TTL_SECONDS)
       .sign(key);
+    this.cachedJwt = { token, expiresAt: (issuedAt + JWT_TTL_SECONDS) * 1000 };
+    return token;
   }
 
   private async request<T>(method: string, path: string, body?: unknown): Promise<T> {
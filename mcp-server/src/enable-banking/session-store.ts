@@ -1,7 +1,7 @@
 import Database from 'better-sqlite3';
-import { createHash } from 'node:crypto';
 import { mkdirSync } from 'node:fs';
 import { dirname } from 'node:path';
+import { hashToken } from '../auth/tokens.js';
 
 export interface SessionRecord {
   token_hash: string;
@@ -11,12 +11,20 @@ export interface SessionRecord {
   expires_at: number;
 }
 
-function hashToken(token: string): string {
-  return createHash('sha256').update(token).digest('hex');
+function prepareStatements(db: Database.Database) {
+  return {
+    upsert: db.prepare(
+      'INSERT OR REPLACE INTO sessions (token_hash, eb_session_id, account_uids, created_at, expires_at) VALUES (?, ?, ?, ?, ?)',
+    ),
+    getByHash: db.prepare('SELECT * FROM sessions WHERE token_hash = ?'),
+    deleteByHash: db.prepare('DELETE FROM sessions WHERE token_hash = ?'),
+    deleteExpired: db.prepare('DELETE FROM sessions WHERE expires_at < ?'),
+  };
 }
 
 export class SessionStore {
   private db: Database.Database;
+  private stmts: ReturnType<typeof prepareStatements>;
 
   constructor(dbPath: string = './data/sessions.db') {
     mkdirSync(dirname(dbPath), { recursive: true });
@@ -29,18 +37,19 @@ export class SessionStore {
         account_uids TEXT NOT NULL,
         created_at INTEGER NOT NULL,
         expires_at INTEGER NOT NULL
-      )
+      );
+      -- cleanup() range-deletes by expiry; avoid a full table scan
+      CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at);
     `);
+    this.stmts = prepareStatements(this.db);
   }
 
   store(mcpToken: string, ebSessionId: string, accountUids: string[], expiresAt: number): void {
-    this.db.prepare(
-      'INSERT OR REPLACE INTO sessions (token_hash, eb_session_id, account_uids, created_at, expires_at) VALUES (?, ?, ?, ?, ?)',
-    ).run(hashToken(mcpToken), ebSessionId, JSON.stringify(accountUids), Date.now(), expiresAt);
+    this.stmts.upsert.run(hashToken(mcpToken), ebSessionId, JSON.stringify(accountUids), Date.now(), expiresAt);
   }
 
   getByToken(mcpToken: string): SessionRecord | null {
-    const row = this.db.prepare('SELECT * FROM sessions WHERE token_hash = ?').get(hashToken(mcpToken)) as
+    const row = this.stmts.getByHash.get(hashToken(mcpToken)) as
       | (Omit<SessionRecord, 'account_uids'> & { account_uids: string })
       | undefined;
     if (!row) return null;
@@ -56,11 +65,11 @@ export class SessionStore {
   }
 
   private revokeByHash(tokenHash: string): void {
-    this.db.prepare('DELETE FROM sessions WHERE token_hash = ?').run(tokenHash);
+    this.stmts.deleteByHash.run(tokenHash);
   }
 
   cleanup(): number {
-    const result = this.db.prepare('DELETE FROM sessions WHERE expires_at < ?').run(Date.now());
+    const result = this.stmts.deleteExpired.run(Date.now());
     return result.changes;
   }
 
@@ -99,7 +99,8 @@ if (oauthProvider) {
     const { code, state, error: ebError } = req.query;
     logOAuth('eb_callback', { hasCode: !!code, hasState: !!state, ebError: ebError || undefined });
     if (ebError) {
-      res.status(400).send(`Enable Banking error: ${ebError}`);
+      // Reflected from the query string — never let it render as HTML
+      res.status(400).type('text/plain').send(`Enable Banking error: ${ebError}`);
       return;
     }
     if (!code || !state || typeof code !== 'string' || typeof state !== 'string') {
@@ -113,7 +114,7 @@ if (oauthProvider) {
       return;
     }
     logOAuth('eb_callback_success', { redirect: result.redirectUrl.substring(0, 100) });
-    res.redirect(result.redirectUrl);
+    res.status(302).location(result.redirectUrl).end();
   });
 }
 
@@ -143,12 +144,20 @@ const authMiddleware = oauthProvider
     })
   : (_req: express.Request, _res: express.Response, next: express.NextFunction) => next();
 
+// Responses on /mcp may be SSE (GET streams and, without enableJsonResponse, POST replies
+// too); stop nginx-style proxies from buffering them
+function disableProxyBuffering(_req: express.Request, res: express.Response, next: express.NextFunction) {
+  res.setHeader('X-Accel-Buffering', 'no');
+  next();
+}
+
 // POST /mcp
-app.post('/mcp', authMiddleware, async (req, res) => {
+app.post('/mcp', authMiddleware, disableProxyBuffering, async (req, res) => {
   const sessionId = req.headers['mcp-session-id'] as string | undefined;
+  const existing = sessionId ? transports.get(sessionId) : undefined;
 
-  if (sessionId && transports.has(sessionId)) {
-    await transports.get(sessionId)!.handleRequest(req, res, req.body);
+  if (existing) {
+    await existing.handleRequest(req, res, req.body);
     return;
   }
 
@@ -177,26 +186,32 @@ app.post('/mcp', authMiddleware, async (req, res) => {
 });
 
 // GET /mcp — SSE
-app.get('/mcp', authMiddleware, async (req, res) => {
+app.get('/mcp', authMiddleware, disableProxyBuffering, async (req, res) => {
   const sessionId = req.headers['mcp-session-id'] as string | undefined;
-  if (!sessionId || !transports.has(sessionId)) {
+  const transport = sessionId ? transports.get(sessionId) : undefined;
+  if (!transport) {
     res.status(400).send('Invalid or missing session ID');
     return;
   }
-  await transports.get(sessionId)!.handleRequest(req, res);
+  await transport.handleRequest(req, res);
 });
 
 // DELETE /mcp — Session termination
-app.delete('/mcp', authMiddleware, async (req, res) => {
+app.delete('/mcp', authMiddleware, disableProxyBuffering, async (req, res) => {
   const sessionId = req.headers['mcp-session-id'] as string | undefined;
-  if (!sessionId || !transports.has(sessionId)) {
+  const transport = sessionId ? transports.get(sessionId) : undefined;
+  if (!transport) {
     res.status(400).send('Invalid or missing session ID');
     return;
   }
-  await transports.get(sessionId)!.handleRequest(req, res);
+  await transport.handleRequest(req, res);
 });
 
 const port = config.port;
-app.listen(port, config.host, () => {
+const httpServer = app.listen(port, config.host, () => {
   logger.info({ port, host: config.host, bank: config.aspspName, country: config.aspspCountry, auth: oauthProvider ? 'oauth' : 'none' }, 'MCP server started');
 });
+// Outlive typical proxy idle timeouts (60s) so clients reuse connections instead of
+// racing Node's 5s default close; headersTimeout must stay above keepAliveTimeout
+httpServer.keepAliveTimeout = 65_000;
+httpServer.headersTimeout = 66_000;
@@ -1,7 +1,10 @@
 import pino from 'pino';
 
-export function createLogger() {
-  return pino({
+// Shared so importing modules don't each spawn their own transport worker
+let logger: pino.Logger | undefined;
+
+export function createLogger(): pino.Logger {
+  logger ??= pino({
     level: process.env.LOG_LEVEL || 'info',
     transport: process.env.NODE_ENV !== 'production'
       ? { target: 'pino-pretty', options: { colorize: true } }
@@ -9,4 +12,5 @@ export function createLogger() {
     // Never log tokens, secrets, or financial PII
     redact: ['req.headers.authorization', 'token', 'accessToken', 'refreshToken', 'privateKey'],
   });
+  return logger;
 }
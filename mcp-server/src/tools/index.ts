@@ -1,6 +1,31 @@
 import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
 import { z } from 'zod';
-import type { EnableBankingClient } from '../enable-banking/client.js';
+import type { EnableBankingClient, EnableBankingTransaction } from '../enable-banking/client.js';
+
+// Assistants call tools in bursts over the same data; keep results briefly per session
+const TRANSACTIONS_TTL_MS = 60_000;
+const TRANSACTIONS_CACHE_MAX = 100;
+// Cap parallel Enable Banking calls when fanning out across accounts
+const ACCOUNT_FETCH_CONCURRENCY = 8;
+
+// Zero-padded dates compare correctly as strings and are what the bank API expects
+const ISO_DATE = /^\d{4}-\d{2}-\d{2}$/;
+
+// Fully static response, serialized once
+const ACCOUNTS_NOT_AUTHENTICATED = JSON.stringify({ accounts: [], note: 'Not authenticated with bank' });
+
+async function mapWithConcurrency<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  const workers = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i]);
+    }
+  });
+  await Promise.all(workers);
+  return results;
+}
 
 export interface ToolContext {
   getClient(): EnableBankingClient | null;
@@ -13,6 +38,38 @@ export interface ToolContext {
  * Tools are pure data access — no business logic.
  */
 export function registerTools(server: McpServer, ctx?: ToolContext): void {
+  const txCache = new Map<string, { expiresAt: number; value: Promise<EnableBankingTransaction[]> }>();
+
+  function getTransactions(
+    client: EnableBankingClient,
+    accountId: string,
+    dateFrom?: string,
+    dateTo?: string,
+  ): Promise<EnableBankingTransaction[]> {
+    const key = `${accountId}|${dateFrom ?? ''}|${dateTo ?? ''}`;
+    const now = Date.now();
+    const hit = txCache.get(key);
+    if (hit) {
+      // Delete then re-insert so Map order tracks recency (LRU); expired entries just go
+      txCache.delete(key);
+      if (hit.expiresAt > now) {
+        txCache.set(key, hit);
+        return hit.value;
+      }
+    }
+
+    if (txCache.size >= TRANSACTIONS_CACHE_MAX) {
+      txCache.delete(txCache.keys().next().value!);
+    }
+    const value = client.getTransactions(accountId, dateFrom, dateTo);
+    txCache.set(key, { expiresAt: now + TRANSACTIONS_TTL_MS, value });
+    // Never cache failures
+    value.catch(() => {
+      if (txCache.get(key)?.value === value) txCache.delete(key);
+    });
+    return value;
+  }
+
   server.tool(
     'accounts',
     'List all accounts at this bank with their IDs and types',
@@ -21,12 +78,12 @@ export function registerTools(server: McpServer, ctx?: ToolContext): void {
       const client = ctx?.getClient();
       const sessionId = ctx?.getSessionId();
       if (!client || !sessionId) {
-        return { content: [{ type: 'text' as const, text: JSON.stringify({ accounts: [], note: 'Not authenticated with bank' }) }] };
+        return { content: [{ type: 'text' as const, text: ACCOUNTS_NOT_AUTHENTICATED }] };
       }
 
       try {
         const session = await client.getSession(sessionId);
-        return { content: [{ type: 'text' as const, text: JSON.stringify({ accounts: session.accounts }, null, 2) }] };
+        return { content: [{ type: 'text' as const, text: JSON.stringify({ accounts: session.accounts }) }] };
       } catch (err) {
         return { content: [{ type: 'text' as const, text: `Error fetching accounts: ${err instanceof Error ? err.message : String(err)}` }], isError: true };
       }
@@ -45,7 +102,7 @@ export function registerTools(server: McpServer, ctx?: ToolContext): void {
 
       try {
         const balances = await client.getBalances(account_id);
-        return { content: [{ type: 'text' as const, text: JSON.stringify({ account_id, balances }, null, 2) }] };
+        return { content: [{ type: 'text' as const, text: JSON.stringify({ account_id, balances }) }] };
       } catch (err) {
         return { content: [{ type: 'text' as const, text: `Error fetching balances: ${err instanceof Error ? err.message : String(err)}` }], isError: true };
       }
@@ -57,8 +114,8 @@ export function registerTools(server: McpServer, ctx?: ToolContext): void {
     'Query transactions for an account within a date range',
     {
       account_id: z.string().describe('The account ID'),
-      date_from: z.string().optional().describe('Start date (YYYY-MM-DD)'),
-      date_to: z.string().optional().describe('End date (YYYY-MM-DD)'),
+      date_from: z.string().regex(ISO_DATE).optional().describe('Start date (YYYY-MM-DD)'),
+      date_to: z.string().regex(ISO_DATE).optional().describe('End date (YYYY-MM-DD)'),
     },
     async ({ account_id, date_from, date_to }) => {
       const client = ctx?.getClient();
@@ -66,9 +123,14 @@ export function registerTools(server: McpServer, ctx?: ToolContext): void {
         return { content: [{ type: 'text' as const, text: JSON.stringify({ account_id, transactions: [], note: 'Not authenticated' }) }] };
       }
 
+      // An inverted range can never match — answer without calling the bank
+      if (date_from && date_to && date_from > date_to) {
+        return { content: [{ type: 'text' as const, text: JSON.stringify({ account_id, date_from, date_to, count: 0, transactions: [] }) }] };
+      }
+
       try {
-        const transactions = await client.getTransactions(account_id, date_from, date_to);
-        return { content: [{ type: 'text' as const, text: JSON.stringify({ account_id, date_from, date_to, count: transactions.length, transactions }, null, 2) }] };
+        const transactions = await getTransactions(client, account_id, date_from, date_to);
+        return { content: [{ type: 'text' as const, text: JSON.stringify({ account_id, date_from, date_to, count: transactions.length, transactions }) }] };
       } catch (err) {
         return { content: [{ type: 'text' as const, text: `Error fetching transactions: ${err instanceof Error ? err.message : String(err)}` }], isError: true };
       }
@@ -90,7 +152,7 @@ export function registerTools(server: McpServer, ctx?: ToolContext): void {
 
       try {
         const details = await client.getTransactionDetails(account_id, transaction_id);
-        return { content: [{ type: 'text' as const, text: JSON.stringify({ account_id, transaction_id, details }, null, 2) }] };
+        return { content: [{ type: 'text' as const, text: JSON.stringify({ account_id, transaction_id, details }) }] };
       } catch (err) {
         return { content: [{ type: 'text' as const, text: `Error fetching transaction: ${err instanceof Error ? err.message : String(err)}` }], isError: true };
       }
@@ -113,24 +175,25 @@ export function registerTools(server: McpServer, ctx?: ToolContext): void {
       try {
         // Get accounts to search across
         const accountIds = account_id ? [account_id] : (ctx?.getAccountUids() ?? []);
-        const allResults: unknown[] = [];
         const lowerQuery = query.toLowerCase();
 
-        for (const accId of accountIds) {
-          const transactions = await client.getTransactions(accId);
-          const matches = transactions.filter(tx => {
+        // Fetch accounts concurrently — latency is the slowest account, not the sum
+        const perAccount = await mapWithConcurrency(accountIds, ACCOUNT_FETCH_CONCURRENCY, async accId => {
+          const matches: unknown[] = [];
+          for (const tx of await getTransactions(client, accId)) {
             const searchable = [
               tx.remittance_information_unstructured,
               tx.creditor_name,
               tx.debtor_name,
               tx.transaction_amount?.amount,
             ].filter(Boolean).join(' ').toLowerCase();
-            return searchable.includes(lowerQuery);
-          });
-          allResults.push(...matches.map(tx => ({ ...tx, account_id: accId })));
-        }
+            if (searchable.includes(lowerQuery)) matches.push({ ...tx, account_id: accId });
+          }
+          return matches;
+        });
+        const allResults = perAccount.flat();
 
-        return { content: [{ type: 'text' as const, text: JSON.stringify({ query, account_id, count: allResults.length, results: allResults }, null, 2) }] };
+        return { content: [{ type: 'text' as const, text: JSON.stringify({ query, account_id, count: allResults.length, results: allResults }) }] };
       } catch (err) {
         return { content: [{ type: 'text' as const, text: `Error searching transactions: ${err instanceof Error ? err.message : String(err)}` }], isError: true };
       }
@@ -1,4 +1,4 @@
-import { describe, it, expect, beforeAll } from 'vitest';
+import { describe, it, expect, beforeAll, vi } from 'vitest';
 import { EnableBankingClient } from '../../src/enable-banking/client.js';
 import { jwtVerify } from 'jose';
 import { generateKeyPairSync, createPublicKey } from 'node:crypto';
@@ -43,6 +43,36 @@ describe('EnableBankingClient', () => {
       expect(jwt1.split('.').length).toBe(3);
       expect(jwt2.split('.').length).toBe(3);
     });
+
+    it('signs once for concurrent callers', async () => {
+      const client = new EnableBankingClient('test-app-id', privateKeyPem);
+      // RS256 is deterministic, so equal tokens alone don't prove a single signing
+      const signJwt = vi.spyOn(client as unknown as { signJwt(): Promise<string> }, 'signJwt');
+      const [jwt1, jwt2, jwt3] = await Promise.all([
+        client.generateJwt(),
+        client.generateJwt(),
+        client.generateJwt(),
+      ]);
+      expect(signJwt).toHaveBeenCalledTimes(1);
+      expect(jwt2).toBe(jwt1);
+      expect(jwt3).toBe(jwt1);
+    });
+
+    it('reuses the signed JWT until shortly before expiry', async () => {
+      vi.useFakeTimers();
+      try {
+        const client = new EnableBankingClient('test-app-id', privateKeyPem);
+        const jwt1 = await client.generateJwt();
+
+        vi.advanceTimersByTime(30 * 60_000);
+        expect(await client.generateJwt()).toBe(jwt1);
+
+        vi.advanceTimersByTime(29 * 60_000 + 45_000);
+        expect(await client.generateJwt()).not.toBe(jwt1);
+      } finally {
+        vi.useRealTimers();
+      }
+    });
   });
 
   describe('API request construction', () => {
@@ -50,5 +80,18 @@ describe('EnableBankingClient', () => {
       const client = new EnableBankingClient('test-app-id', privateKeyPem, 'http://127.0.0.1:1');
       await expect(client.listAspsps('FI')).rejects.toThrow();
     });
+
+    it('queries the API on every listAspsps call (used as the /health probe)', async () => {
+      const fetchMock = vi.fn(async () => new Response(JSON.stringify({ aspsps: [{ name: 'Nordea', country: 'FI' }] })));
+      vi.stubGlobal('fetch', fetchMock);
+      try {
+        const client = new EnableBankingClient('test-app-id', privateKeyPem, 'https://api.test.com');
+        expect(await client.listAspsps('FI')).toEqual([{ name: 'Nordea', country: 'FI' }]);
+        await client.listAspsps('FI');
+        expect(fetchMock).toHaveBeenCalledTimes(2);
+      } finally {
+        vi.unstubAllGlobals();
+      }
+    });
   });
 });
@@ -0,0 +1,103 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import Database from 'better-sqlite3';
+import { randomUUID } from 'node:crypto';
+import { rmSync } from 'node:fs';
+import type { OAuthClientInformationFull } from '@modelcontextprotocol/sdk/shared/auth.js';
+import { EnableBankingOAuthProvider } from '../../src/auth/oauth-provider.js';
+import { hashToken } from '../../src/auth/tokens.js';
+import type { EnableBankingClient } from '../../src/enable-banking/client.js';
+
+const REDIRECT_URI = 'https://claude.ai/api/mcp/auth_callback';
+const client = { client_id: 'client-1', redirect_uris: [REDIRECT_URI] } as OAuthClientInformationFull;
+const otherClient = { client_id: 'client-2', redirect_uris: [REDIRECT_URI] } as OAuthClientInformationFull;
+
+describe('EnableBankingOAuthProvider', () => {
+  let dataDir: string;
+  let provider: EnableBankingOAuthProvider;
+  let db: Database.Database;
+
+  beforeEach(() => {
+    dataDir = `./data/test-oauth-${randomUUID()}`;
+    provider = new EnableBankingOAuthProvider({
+      dataDir,
+      externalUrl: 'http://localhost:8081',
+      aspspName: 'MOCKASPSP_SANDBOX',
+      aspspCountry: 'FI',
+      enableBankingClient: {
+        createSession: vi.fn(async () => ({ session_id: 'eb-session-1', accounts: [{ uid: 'acc-1' }] })),
+      } as unknown as EnableBankingClient,
+    });
+    // Second connection to the provider's database for seeding and inspecting rows
+    db = new Database(`${dataDir}/oauth.db`);
+  });
+
+  afterEach(() => {
+    db.close();
+    provider.close();
+    rmSync(dataDir, { recursive: true, force: true });
+  });
+
+  function seedAuthCode(code: string): void {
+    const now = Date.now();
+    db.prepare(`
+      INSERT INTO auth_codes (code_hash, eb_session_id, account_uids, client_id, redirect_uri, code_challenge, created_at, expires_at, used)
+      VALUES (?, 'eb-session-1', '["acc-1"]', ?, ?, 'challenge', ?, ?, 0)
+    `).run(hashToken(code), client.client_id, REDIRECT_URI, now, now + 300_000);
+  }
+
+  function seedPendingAuth(ebState: string, expiresAt: number): void {
+    db.prepare(`
+      INSERT INTO pending_auths (eb_state, claude_state, client_id, redirect_uri, code_challenge, code_challenge_method, created_at, expires_at)
+      VALUES (?, 'claude-state', ?, ?, 'challenge', 'S256', ?, ?)
+    `).run(ebState, client.client_id, REDIRECT_URI, Date.now(), expiresAt);
+  }
+
+  it('rejects a second exchange of the same authorization code', async () => {
+    seedAuthCode('code-1');
+
+    const tokens = await provider.exchangeAuthorizationCode(client, 'code-1');
+    expect(tokens.access_token).toBeTruthy();
+
+    await expect(provider.exchangeAuthorizationCode(client, 'code-1')).rejects.toThrow('Invalid or expired authorization code');
+  });
+
+  it('rejects a refresh token after it has been rotated', async () => {
+    seedAuthCode('code-1');
+    const { refresh_token } = await provider.exchangeAuthorizationCode(client, 'code-1');
+
+    const rotated = await provider.exchangeRefreshToken(client, refresh_token!);
+    expect(rotated.refresh_token).not.toBe(refresh_token);
+
+    await expect(provider.exchangeRefreshToken(client, refresh_token!)).rejects.toThrow('Invalid or expired refresh token');
+  });
+
+  it('rejects a refresh from another client without revoking the token', async () => {
+    seedAuthCode('code-1');
+    const { refresh_token } = await provider.exchangeAuthorizationCode(client, 'code-1');
+
+    await expect(provider.exchangeRefreshToken(otherClient, refresh_token!)).rejects.toThrow();
+
+    const row = db.prepare('SELECT revoked FROM refresh_tokens WHERE token_hash = ?').get(hashToken(refresh_token!)) as { revoked: number };
+    expect(row.revoked).toBe(0);
+    await expect(provider.exchangeRefreshToken(client, refresh_token!)).resolves.toHaveProperty('access_token');
+  });
+
+  it('rejects and deletes an expired pending auth', async () => {
+    seedPendingAuth('eb-state-1', Date.now() - 1000);
+
+    const result = await provider.handleEbCallback('eb-code', 'eb-state-1');
+
+    expect(result).toEqual({ error: 'Invalid or expired state' });
+    expect(db.prepare('SELECT COUNT(*) AS n FROM pending_auths').get()).toEqual({ n: 0 });
+  });
+
+  it('consumes a pending auth only once', async () => {
+    seedPendingAuth('eb-state-1', Date.now() + 300_000);
+
+    const first = await provider.handleEbCallback('eb-code', 'eb-state-1');
+    expect(first).toHaveProperty('redirectUrl');
+    expect(new URL((first as { redirectUrl: string }).redirectUrl).searchParams.get('code')).toBeTruthy();
+
+    expect(await provider.handleEbCallback('eb-code', 'eb-state-1')).toEqual({ error: 'Invalid or expired state' });
+  });
+});
@@ -1,8 +1,9 @@
-import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 import { Client } from '@modelcontextprotocol/sdk/client/index.js';
 import { InMemoryTransport } from '@modelcontextprotocol/sdk/inMemory.js';
 import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
 import { registerTools } from '../../src/tools/index.js';
+import type { EnableBankingClient } from '../../src/enable-banking/client.js';
 
 describe('MCP Tools', () => {
   let client: Client;
@@ -64,6 +65,15 @@ describe('MCP Tools', () => {
     expect(data).toHaveProperty('transactions');
   });
 
+  it('transactions tool reports missing auth even for an inverted date range', async () => {
+    const result = await client.callTool({
+      name: 'transactions',
+      arguments: { account_id: 'acc-123', date_from: '2026-02-01', date_to: '2026-01-01' },
+    });
+    const data = JSON.parse((result.content[0] as { type: 'text'; text: string }).text);
+    expect(data.note).toBe('Not authenticated');
+  });
+
   it('transaction tool returns details for specific transaction', async () => {
     const result = await client.callTool({
       name: 'transaction',
@@ -92,3 +102,92 @@ describe('MCP Tools', () => {
     }
   });
 });
+
+describe('MCP Tools with a bank client', () => {
+  let client: Client;
+  let server: McpServer;
+  const getTransactions = vi.fn(async () => [
+    { transaction_id: 'tx-1', transaction_amount: { amount: '12.50', currency: 'EUR' }, creditor_name: 'Grocery Store' },
+  ]);
+
+  beforeEach(async () => {
+    getTransactions.mockClear();
+    const [clientTransport, serverTransport] = InMemoryTransport.createLinkedPair();
+
+    server = new McpServer(
+      { name: 'test-server', version: '1.0.0' },
+      { capabilities: { tools: {} } },
+    );
+    registerTools(server, {
+      getClient: () => ({ getTransactions }) as unknown as EnableBankingClient,
+      getAccountUids: () => ['acc-1', 'acc-2'],
+      getSessionId: () => 'eb-session-1',
+    });
+
+    client = new Client({ name: 'test-client', version: '1.0.0' });
+
+    await server.connect(serverTransport);
+    await client.connect(clientTransport);
+  });
+
+  afterEach(async () => {
+    await client.close();
+    await server.close();
+  });
+
+  it('reuses fetched transactions across tool calls in a burst', async () => {
+    await client.callTool({ name: 'transactions', arguments: { account_id: 'acc-1' } });
+    await client.callTool({ name: 'search', arguments: { query: 'grocery' } });
+    await client.callTool({ name: 'search', arguments: { query: 'store' } });
+
+    // acc-1 fetched once and shared, acc-2 fetched once by the first search
+    expect(getTransactions).toHaveBeenCalledTimes(2);
+  });
+
+  it('refetches transactions once the cache entry expires', async () => {
+    vi.useFakeTimers({ toFake: ['Date'] });
+    try {
+      const start = Date.now();
+      await client.callTool({ name: 'transactions', arguments: { account_id: 'acc-1' } });
+      vi.setSystemTime(start + 59_000);
+      await client.callTool({ name: 'transactions', arguments: { account_id: 'acc-1' } });
+      expect(getTransactions).toHaveBeenCalledTimes(1);
+
+      // Past TRANSACTIONS_TTL_MS (60s) from the first fetch
+      vi.setSystemTime(start + 61_000);
+      await client.callTool({ name: 'transactions', arguments: { account_id: 'acc-1' } });
+      expect(getTransactions).toHaveBeenCalledTimes(2);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
+  it('evicts the least recently used entry when the cache is full', async () => {
+    const dateTo = (i: number) => new Date(Date.UTC(2025, 0, 1 + i)).toISOString().slice(0, 10);
+    const query = (i: number) =>
+      client.callTool({ name: 'transactions', arguments: { account_id: 'acc-1', date_from: '2025-01-01', date_to: dateTo(i) } });
+
+    // Fill the cache (TRANSACTIONS_CACHE_MAX = 100), then touch the oldest entry
+    for (let i = 0; i < 100; i++) await query(i);
+    await query(0);
+    expect(getTransactions).toHaveBeenCalledTimes(100);
+
+    // A new key evicts entry 1, the least recently used, not entry 0
+    await query(100);
+    await query(0);
+    expect(getTransactions).toHaveBeenCalledTimes(101);
+    await query(1);
+    expect(getTransactions).toHaveBeenCalledTimes(102);
+  });
+
+  it('returns an empty result for an inverted date range without calling the bank', async () => {
+    const result = await client.callTool({
+      name: 'transactions',
+      arguments: { account_id: 'acc-1', date_from: '2026-02-01', date_to: '2026-01-01' },
+    });
+    const data = JSON.parse((result.content[0] as { type: 'text'; text: string }).text);
+    expect(data.count).toBe(0);
+    expect(data.transactions).toEqual([]);
+    expect(getTransactions).not.toHaveBeenCalled();
+  });
+});
@@ -4,7 +4,7 @@ ADHD Budget Assistant - Core Modules
 
 from .categorizer import TransactionCategorizer
 from .projector import SpendingProjector
-from .outlier_detector import OutlierDetector
+from .outlier_detector import Outlier, OutlierDetector
 from .mcp_server import MCPServer
 from .scheduler import DailySummaryScheduler
 from .data_flow import DataFlowManager
@@ -12,6 +12,7 @@ from .data_flow import DataFlowManager
 __all__ = [
     'TransactionCategorizer',
     'SpendingProjector',
+    'Outlier',
     'OutlierDetector',
     'MCPServer',
     'DailySummaryScheduler',
@@ -3,7 +3,8 @@ Transaction Categorizer Module
 Implements T3 Gate: Categorization accuracy ≥80%
 """
 
-from typing import Dict, List
+import re
+from typing import Dict, Iterable, List
 
 
 class TransactionCategorizer:
@@ -26,6 +27,12 @@ class TransactionCategorizer:
         'rent': ['rent', 'lease', 'landlord', 'property management'],
     }
     
+    # One compiled alternation per category, checked in rule order
+    _CATEGORY_PATTERNS = [
+        (category, re.compile('|'.join(re.escape(keyword) for keyword in keywords)))
+        for category, keywords in CATEGORY_RULES.items()
+    ]
+    
     def categorize(self, transaction: Dict) -> str:
         """
         Categorize a transaction based on merchant and description
@@ -48,13 +55,48 @@ class TransactionCategorizer:
         if merchant is None:
             merchant = ''
             
-        description = description.lower()
-        merchant = merchant.lower()
+        # Keywords never contain a newline, so matches cannot span both fields
+        text = f"{description}\n{merchant}".lower()
         
         # Check against rules
-        for category, keywords in self.CATEGORY_RULES.items():
-            for keyword in keywords:
-                if keyword in description or keyword in merchant:
-                    return category
+        for category, pattern in self._CATEGORY_PATTERNS:
+            if pattern.search(text):
+                return category
+        
+        return 'other'
+    
+    def categorize_many(self, transactions: Iterable[Dict]) -> List[str]:
+        """
+        Categorize a batch of transactions in one pass
+        
+        Same rules as categorize(), inlined so the per-item cost is the
+        matching alone; test_categorize_many_matches_categorize keeps the
+        two in step.
+        
+        Args:
+            transactions: Iterable of transaction dicts (None entries allowed)
+            
+        Returns:
+            Category strings in input order, matching categorize() per item
+        """
+        patterns = self._CATEGORY_PATTERNS
+        categories = []
+        append = categories.append
+        
+        for transaction in transactions:
+            if transaction is None:
+                append('other')
+                continue
+            
+            description = transaction.get('description', '')
+            merchant = transaction.get('merchant', '')
+            text = f"{'' if description is None else description}\n{'' if merchant is None else merchant}".lower()
+            
+            for category, pattern in patterns:
+                if pattern.search(text):
+                    append(category)
+                    break
+            else:
+                append('other')
         
-        return 'other'
\ No newline at end of file
+        return categories
@@ -3,8 +3,54 @@ Outlier Detection Module
 Implements T3 Gate: Outlier detection with <10% false positives
 """
 
-import statistics
-from typing import Dict, List
+import math
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import Dict, Iterator, List
+
+
+class Outlier(Mapping):
+    """
+    A flagged transaction: the original record plus why it was flagged
+    
+    Reads like the merged dicts detect_outliers used to return ('in',
+    dict(), ** and .get() all work) without copying the transaction.
+    Use to_dict() for json.dumps, which only accepts real dicts.
+    """
+    
+    __slots__ = ('transaction', 'reason')
+    
+    _FLAG_KEYS = ('is_outlier', 'outlier_reason')
+    
+    def __init__(self, transaction: Dict, reason: str):
+        self.transaction = transaction
+        self.reason = reason
+    
+    def __getitem__(self, key: str):
+        if key == 'is_outlier':
+            return True
+        if key == 'outlier_reason':
+            return self.reason
+        return self.transaction[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        for key in self.transaction:
+            if key not in self._FLAG_KEYS:
+                yield key
+        yield from self._FLAG_KEYS
+    
+    def __len__(self) -> int:
+        return len(self.transaction.keys() - self._FLAG_KEYS) + len(self._FLAG_KEYS)
+    
+    def to_dict(self) -> Dict:
+        """Merge into a plain dict for serialization"""
+        merged = self.transaction.copy()
+        merged['is_outlier'] = True
+        merged['outlier_reason'] = self.reason
+        return merged
+    
+    def __repr__(self) -> str:
+        return f"Outlier({self.transaction!r}, {self.reason!r})"
 
 
 class OutlierDetector:
@@ -21,7 +67,7 @@ class OutlierDetector:
         self.zscore_threshold = zscore_threshold
         self.budget_percentage = budget_percentage
     
-    def detect_outliers(self, transactions: List[Dict], monthly_budget: float = 3000.0) -> List[Dict]:
+    def detect_outliers(self, transactions: List[Dict], monthly_budget: float = 3000.0) -> List[Outlier]:
         """
         Detect outliers using statistical and budget-based rules
         
@@ -34,41 +80,52 @@ class OutlierDetector:
             monthly_budget: Monthly budget for comparison
             
         Returns:
-            List of outlier transactions
+            List of Outlier records referencing the original transactions
         """
         if not transactions:
             return []
         
-        amounts = [t['amount'] for t in transactions]
+        get_amount = itemgetter('amount')
         
-        # Statistical outliers (z-score)
-        mean = statistics.mean(amounts)
-        std_dev = statistics.stdev(amounts) if len(amounts) > 1 else 0
+        # Statistical outliers (z-score): Welford's single-pass mean/variance
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        for transaction in transactions:
+            x = float(get_amount(transaction))
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+        std_dev = math.sqrt(m2 / (n - 1)) if n > 1 else 0
         statistical_threshold = mean + (self.zscore_threshold * std_dev)
         
         # Budget-based outliers
         budget_threshold = monthly_budget * self.budget_percentage
         
+        # Anything at or below the lowest active threshold can't be an outlier,
+        # so most transactions are rejected with a single comparison
+        std_positive = std_dev > 0
+        cutoff = min(statistical_threshold, budget_threshold) if std_positive else budget_threshold
+        
+        # Reason strings depend only on the thresholds, so format them once
+        statistical_reason = f"statistical (>{statistical_threshold:.2f})"
+        budget_reason = f"budget (>{budget_threshold:.2f})"
+        both_reasons = f"{statistical_reason}, {budget_reason}"
+        
         outliers = []
+        append = outliers.append
         for transaction in transactions:
-            amount = transaction['amount']
-            is_outlier = False
-            reason = []
-            
-            if std_dev > 0 and amount > statistical_threshold:
-                is_outlier = True
-                reason.append(f"statistical (>{statistical_threshold:.2f})")
+            amount = get_amount(transaction)
+            if amount <= cutoff:
+                continue
             
-            if amount > budget_threshold:
-                is_outlier = True
-                reason.append(f"budget (>{budget_threshold:.2f})")
+            if std_positive and amount > statistical_threshold:
+                reason = both_reasons if amount > budget_threshold else statistical_reason
+            else:
+                reason = budget_reason
             
-            if is_outlier:
-                outliers.append({
-                    **transaction,
-                    'is_outlier': True,
-                    'outlier_reason': ', '.join(reason)
-                })
+            append(Outlier(transaction, reason))
         
         return outliers
     
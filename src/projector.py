@@ -3,20 +3,42 @@ Spending Projector Module
 Implements T3 Gate: Projection accuracy ±5%
 """
 
+import calendar
 from typing import Dict
 from decimal import Decimal
 
 
+# Default month length used when the caller doesn't supply the real one
+DAYS_IN_MONTH = 30
+
+
 class SpendingProjector:
     """Projects monthly spending and calculates budget variance"""
     
-    def calculate_monthly_pace(self, daily_spend: float, day_of_month: int) -> float:
+    @staticmethod
+    def days_in_month(year: int, month: int) -> int:
+        """
+        Number of days in a calendar month (handles leap years and December)
+        
+        Args:
+            year: Calendar year
+            month: Month number (1-12)
+            
+        Returns:
+            Days in the month
+        """
+        return calendar.monthrange(year, month)[1]
+    
+    @staticmethod
+    def calculate_monthly_pace(daily_spend: float, day_of_month: int,
+                               days_in_month: int = DAYS_IN_MONTH) -> float:
         """
         Project monthly spending based on current pace
         
         Args:
             daily_spend: Total spending so far this month
             day_of_month: Current day of the month
+            days_in_month: Length of the month (default DAYS_IN_MONTH; see days_in_month())
             
         Returns:
             Projected monthly spend
@@ -27,14 +49,13 @@ class SpendingProjector:
         # Calculate average daily rate from total spending so far
         daily_rate = daily_spend / day_of_month
         
-        # Project for full month (assume 30 days)
-        days_in_month = 30
+        # Project for full month
         return daily_rate * days_in_month
     
-    def calculate_month_end_balance(self, 
-                                   starting_balance: float,
-                                   spent_so_far: float,
-                                   projected_spend: float) -> float:
+    @staticmethod
+    def calculate_month_end_balance(starting_balance: float,
+                                    spent_so_far: float,
+                                    projected_spend: float) -> float:
         """
         Calculate projected month-end balance
         
@@ -49,7 +70,8 @@ class SpendingProjector:
         remaining_spend = projected_spend - spent_so_far
         return starting_balance - remaining_spend
     
-    def calculate_vs_budget(self, projected_spend: float, budget: float) -> Dict:
+    @staticmethod
+    def calculate_vs_budget(projected_spend: float, budget: float) -> Dict:
         """
         Calculate budget variance
         
@@ -69,4 +91,40 @@ class SpendingProjector:
             'variance': variance,
             'percentage': percentage,
             'status': 'over' if variance > 0 else 'under'
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def project(daily_spend: float,
+                day_of_month: int,
+                starting_balance: float,
+                spent_so_far: float,
+                budget: float,
+                days_in_month: int = DAYS_IN_MONTH) -> Dict:
+        """
+        Pace, month-end balance and budget variance in one pass
+        
+        Equivalent to chaining calculate_monthly_pace, calculate_month_end_balance
+        and calculate_vs_budget, with each zero-check done once.
+        
+        Args:
+            daily_spend: Total spending so far this month
+            day_of_month: Current day of the month
+            starting_balance: Balance at start of month
+            spent_so_far: Amount already spent this month
+            budget: Monthly budget
+            days_in_month: Length of the month (default DAYS_IN_MONTH)
+            
+        Returns:
+            calculate_vs_budget's dict plus 'month_end_balance'
+        """
+        projected = daily_spend / day_of_month * days_in_month if day_of_month else 0.0
+        variance = projected - budget
+        
+        return {
+            'projected': projected,
+            'budget': budget,
+            'variance': variance,
+            'percentage': (abs(variance) / budget * 100) if budget > 0 else 0,
+            'status': 'over' if variance > 0 else 'under',
+            'month_end_balance': starting_balance - (projected - spent_so_far),
+        }
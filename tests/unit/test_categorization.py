@@ -110,6 +110,19 @@ class TestCategorization:
             category = categorizer.categorize(transaction)
             assert isinstance(category, str)
             assert category in ['transport', 'eating_out', 'other']
+    
+    def test_categorize_many_matches_categorize(self, categorizer, labeled_transactions):
+        """Test that batch categorization agrees with per-transaction results"""
+        transactions = labeled_transactions + [
+            None,
+            {"merchant": None, "description": None},
+            {"description": "UBER EATS"},
+            {"merchant": "Tesco", "description": ""},
+        ]
+        
+        expected = [categorizer.categorize(t) for t in transactions]
+        assert categorizer.categorize_many(transactions) == expected
+        assert categorizer.categorize_many([]) == []
 
 
 if __name__ == "__main__":
@@ -5,10 +5,17 @@ Gate: T3
 
 import json
 import pytest
+import random
 import statistics
+import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import outlier_detector
+
 # Mock implementation - replace with actual imports
 class OutlierDetector:
     """Mock outlier detector - replace with actual implementation"""
@@ -262,5 +269,87 @@ class TestOutliers:
         print(f"Detected outlier amounts: {outlier_amounts}")
 
 
+class TestOutlierDetectorImplementation:
+    """Tests against the real src/outlier_detector.py (the suite above uses a mock)"""
+    
+    @pytest.fixture
+    def detector(self):
+        """Initialize the real outlier detector"""
+        return outlier_detector.OutlierDetector(zscore_threshold=2.0, budget_percentage=0.2)
+    
+    @pytest.fixture
+    def transactions(self):
+        """Ten normal amounts plus one large and one very large transaction"""
+        return [
+            {'id': str(i), 'amount': amount, 'description': 'Normal'}
+            for i, amount in enumerate([10.0, 12.0, 11.0, 13.0, 10.5, 12.5, 11.5, 9.0, 14.0, 10.0])
+        ] + [
+            {'id': 'big', 'amount': 120.0, 'description': 'Large'},
+            {'id': 'huge', 'amount': 900.0, 'description': 'Very large'},
+        ]
+    
+    def test_matches_reference_implementation(self, detector, transactions):
+        """Test that results match the straightforward two-pass reference"""
+        reference = OutlierDetector(zscore_threshold=2.0, budget_percentage=0.2)
+        
+        # Statistical only, both rules, and budget-only reasons respectively
+        for budget in (5000.0, 3000.0, 400.0):
+            detected = [o.to_dict() for o in detector.detect_outliers(transactions, budget)]
+            assert detected == reference.detect_outliers(transactions, budget)
+        
+        assert detector.detect_outliers([]) == []
+    
+    def test_matches_reference_on_random_datasets(self, detector):
+        """Test the single-pass detector against the two-pass reference on seeded random data"""
+        reference = OutlierDetector(zscore_threshold=2.0, budget_percentage=0.2)
+        rng = random.Random(1)
+        
+        for _ in range(2000):
+            n = rng.randint(0, 30)
+            if n and rng.random() < 0.1:
+                # Constant amounts: zero standard deviation
+                transactions = [{'id': str(i), 'amount': 50.0} for i in range(n)]
+            else:
+                transactions = [
+                    {'id': str(i), 'amount': round(rng.choice([rng.uniform(1, 80), rng.uniform(1, 1500)]), 2)}
+                    for i in range(n)
+                ]
+            budget = rng.choice([500.0, 3000.0, 10000.0])
+            
+            detected = [o.to_dict() for o in detector.detect_outliers(transactions, budget)]
+            assert detected == reference.detect_outliers(transactions, budget)
+    
+    def test_outlier_behaves_like_merged_dict(self, detector, transactions):
+        """Test that Outlier records support the dict protocol of the old merged dicts"""
+        outlier = detector.detect_outliers(transactions, monthly_budget=3000.0)[-1]
+        expected = {**transactions[-1], 'is_outlier': True, 'outlier_reason': outlier.reason}
+        
+        assert isinstance(outlier, outlier_detector.Outlier)
+        assert 'is_outlier' in outlier and 'outlier_reason' in outlier
+        assert 'missing' not in outlier
+        assert outlier['id'] == 'huge'
+        assert outlier.get('missing', 'default') == 'default'
+        assert dict(outlier) == expected
+        assert {**outlier} == expected
+        assert len(outlier) == len(expected)
+        assert outlier == expected
+        assert json.loads(json.dumps(outlier.to_dict())) == expected
+    
+    def test_does_not_copy_or_mutate_transactions(self, detector, transactions):
+        """Test that outliers reference the original transactions unchanged"""
+        outlier = detector.detect_outliers(transactions, monthly_budget=3000.0)[-1]
+        
+        assert outlier.transaction is transactions[-1]
+        assert 'is_outlier' not in transactions[-1]
+    
+    def test_existing_flag_keys_are_overridden(self):
+        """Test that flag keys already on a transaction are not reported twice"""
+        outlier = outlier_detector.Outlier({'id': '1', 'is_outlier': False}, 'budget (>600.00)')
+        
+        assert outlier['is_outlier'] is True
+        assert list(outlier) == ['id', 'is_outlier', 'outlier_reason']
+        assert len(outlier) == 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file